@@ -59,6 +59,9 @@ bool AttributeFileExporter::openOutputFile(const QString& filePath, int numberOf
  *****************************************************************************/
 void AttributeFileExporter::closeOutputFile(bool exportCompleted)
 {
+	// Write any buffered text to the output file.
+	if(_outputStream && exportCompleted)
+		_outputStream->flush();
 	_outputStream.reset();
 	if(_outputFile.isOpen())
 		_outputFile.close();
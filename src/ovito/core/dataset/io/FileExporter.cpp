@@ -264,17 +264,17 @@ bool FileExporter::doExport(SynchronousOperation operation)
 			// Go to next animation frame.
 			exportTime += dataset()->animationSettings()->ticksPerFrame() * everyNthFrame();
 		}
+
+		// Close output file.
+		if(!exportAnimation() || !useWildcardFilename()) {
+			closeOutputFile(!operation.isCanceled());
+		}
 	}
 	catch(...) {
 		closeOutputFile(false);
 		throw;
 	}
 
-	// Close output file.
-	if(!exportAnimation() || !useWildcardFilename()) {
-		closeOutputFile(!operation.isCanceled());
-	}
-
 	return !operation.isCanceled();
 }
 
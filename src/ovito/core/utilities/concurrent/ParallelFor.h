@@ -41,32 +41,35 @@ bool parallelFor(
 	promise.setProgressMaximum(loopCount / progressChunkSize);
 	promise.setProgressValue(0);
 
+	// The loop range is handed out to the worker threads dynamically in small blocks.
+	// This balances the load in case the cost of the kernel varies strongly between iterations,
+	// e.g. in dense and dilute regions of a particle system.
+	const T blockSize = 64;
+	std::atomic<T> nextBlockStart(0);
+
 	std::vector<std::future<void>> workers;
 	size_t num_threads = Application::instance()->idealThreadCount();
-	T chunkSize = loopCount / num_threads;
-	T startIndex = 0;
-	T endIndex = chunkSize;
 	for(size_t t = 0; t < num_threads; t++) {
-		if(t == num_threads - 1)
-			endIndex += loopCount % num_threads;
-		workers.push_back(std::async(std::launch::async, [&promise, &kernel, startIndex, endIndex, progressChunkSize]() {
-			for(T i = startIndex; i < endIndex;) {
-				// Execute kernel.
-				kernel(i);
+		workers.push_back(std::async(std::launch::async, [&promise, &kernel, &nextBlockStart, blockSize, loopCount, progressChunkSize]() {
+			for(;;) {
+				T startIndex = nextBlockStart.fetch_add(blockSize, std::memory_order_relaxed);
+				if(startIndex >= loopCount)
+					return;
+				T endIndex = std::min(startIndex + blockSize, loopCount);
+				for(T i = startIndex; i < endIndex; ++i) {
+					// Execute kernel.
+					kernel(i);
 
-				i++;
+					if(promise.isCanceled())
+						return;
+				}
 
 				// Update progress indicator.
-				if((i % progressChunkSize) == 0) {
-					OVITO_ASSERT(i != 0);
-					promise.incrementProgressValue();
-				}
-				if(promise.isCanceled())
-					return;
+				T progressSteps = endIndex / progressChunkSize - startIndex / progressChunkSize;
+				if(progressSteps != 0)
+					promise.incrementProgressValue(progressSteps);
 			}
 		}));
-		startIndex = endIndex;
-		endIndex += chunkSize;
 	}
 
 	for(auto& t : workers)
@@ -74,7 +77,6 @@ bool parallelFor(
 	for(auto& t : workers)
 		t.get();
 
-	promise.incrementProgressValue(loopCount % progressChunkSize);
 	return !promise.isCanceled();
 }
 
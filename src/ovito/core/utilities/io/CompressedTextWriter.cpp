@@ -36,7 +36,8 @@ CompressedTextWriter::CompressedTextWriter(QFileDevice& output, DataSet* context
 #ifdef OVITO_ZLIB_SUPPORT
 	_compressor(&output), 
 #endif
-	_context(context)
+	_context(context),
+	_buffer(new char[OutputBufferCapacity])
 {
 	_filename = output.fileName();
 
@@ -60,6 +61,33 @@ CompressedTextWriter::CompressedTextWriter(QFileDevice& output, DataSet* context
 	}
 }
 
+/******************************************************************************
+* Writes any remaining buffered data to the output device.
+******************************************************************************/
+CompressedTextWriter::~CompressedTextWriter()
+{
+	try {
+		flush();
+	}
+	catch(const Exception&) {
+		// Write errors cannot be reported from the destructor.
+		// Exporters call flush() explicitly before closing the output file to detect them.
+	}
+}
+
+/******************************************************************************
+* Writes the contents of the internal output buffer to the underlying device.
+******************************************************************************/
+void CompressedTextWriter::flush()
+{
+	if(_bufferSize != 0) {
+		size_t count = _bufferSize;
+		_bufferSize = 0;
+		if(_stream->write(_buffer.get(), count) == -1)
+			reportWriteError();
+	}
+}
+
 /******************************************************************************
 * Writes an integer number to the text-based output file.
 ******************************************************************************/
@@ -71,8 +99,7 @@ CompressedTextWriter& CompressedTextWriter::operator<<(qint32 i)
 	char *s = buffer;
 	karma::generate(s, karma::int_generator<qint32>(), i);
 	OVITO_ASSERT(s - buffer < sizeof(buffer));
-	if(_stream->write(buffer, s - buffer) == -1)
-		reportWriteError();
+	write(buffer, s - buffer);
 
 	return *this;
 }
@@ -88,8 +115,7 @@ CompressedTextWriter& CompressedTextWriter::operator<<(quint32 i)
 	char *s = buffer;
 	karma::generate(s, karma::uint_generator<quint32>(), i);
 	OVITO_ASSERT(s - buffer < sizeof(buffer));
-	if(_stream->write(buffer, s - buffer) == -1)
-		reportWriteError();
+	write(buffer, s - buffer);
 
 	return *this;
 }
@@ -105,8 +131,7 @@ CompressedTextWriter& CompressedTextWriter::operator<<(qint64 i)
 	char *s = buffer;
 	karma::generate(s, karma::int_generator<qint64>(), i);
 	OVITO_ASSERT(s - buffer < sizeof(buffer));
-	if(_stream->write(buffer, s - buffer) == -1)
-		reportWriteError();
+	write(buffer, s - buffer);
 
 	return *this;
 }
@@ -122,8 +147,7 @@ CompressedTextWriter& CompressedTextWriter::operator<<(quint64 i)
 	char *s = buffer;
 	karma::generate(s, karma::uint_generator<quint64>(), i);
 	OVITO_ASSERT(s - buffer < sizeof(buffer));
-	if(_stream->write(buffer, s - buffer) == -1)
-		reportWriteError();
+	write(buffer, s - buffer);
 
 	return *this;
 }
@@ -140,8 +164,7 @@ CompressedTextWriter& CompressedTextWriter::operator<<(size_t i)
 	char *s = buffer;
 	karma::generate(s, karma::uint_generator<size_t>(), i);
 	OVITO_ASSERT(s - buffer < sizeof(buffer));
-	if(_stream->write(buffer, s - buffer) == -1)
-		reportWriteError();
+	write(buffer, s - buffer);
 
 	return *this;
 }
@@ -181,8 +204,7 @@ CompressedTextWriter& CompressedTextWriter::operator<<(FloatType f)
 	}
 
 	OVITO_ASSERT(s - buffer < sizeof(buffer));
-	if(_stream->write(buffer, s - buffer) == -1)
-		reportWriteError();
+	write(buffer, s - buffer);
 
 	return *this;
 }
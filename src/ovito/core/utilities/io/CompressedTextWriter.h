@@ -48,6 +48,9 @@ public:
 	/// \throw Exception if an I/O error has occurred.
 	CompressedTextWriter(QFileDevice& output, DataSet* context = nullptr);
 
+	/// Destructor, which writes any remaining buffered data to the output device.
+	~CompressedTextWriter();
+
 	/// Returns the name of the output file.
 	const QString& filename() const { return _filename; }
 
@@ -79,15 +82,15 @@ public:
 
 	/// Writes a text string to the text-based output file.
 	CompressedTextWriter& operator<<(const char* s) {
-		if(_stream->write(s) == -1)
-			reportWriteError();
+		write(s, std::strlen(s));
 		return *this;
 	}
 
 	/// Writes a single character to the text-based output file.
 	CompressedTextWriter& operator<<(char c) {
-		if(!_stream->putChar(c))
-			reportWriteError();
+		if(_bufferSize == OutputBufferCapacity)
+			flush();
+		_buffer[_bufferSize++] = c;
 		return *this;
 	}
 
@@ -102,8 +105,27 @@ public:
 		_floatPrecision = std::min(precision, (unsigned int)std::numeric_limits<FloatType>::max_digits10);
 	}
 
+	/// Writes the contents of the internal output buffer to the underlying device.
+	/// \throw Exception if an I/O error has occurred.
+	void flush();
+
 private:
 
+	/// Appends a sequence of characters to the internal output buffer.
+	void write(const char* s, size_t count) {
+		if(count > OutputBufferCapacity - _bufferSize) {
+			flush();
+			if(count >= OutputBufferCapacity) {
+				// Pass large blocks directly to the output device.
+				if(_stream->write(s, count) == -1)
+					reportWriteError();
+				return;
+			}
+		}
+		std::memcpy(_buffer.get() + _bufferSize, s, count);
+		_bufferSize += count;
+	}
+
 	/// Throws an exception to report an I/O error.
 	void reportWriteError();
 
@@ -127,6 +149,17 @@ private:
 	/// The output precision for floating-point numbers.
 	unsigned int _floatPrecision = 10;
 
+	/// Size of the internal output buffer. Formatted text is collected in this buffer and
+	/// handed to the I/O device in large blocks, because every call to QIODevice::write()
+	/// has a significant fixed cost (and runs the zlib compressor when writing .gz files).
+	static constexpr size_t OutputBufferCapacity = 64 * 1024;
+
+	/// The internal output buffer.
+	std::unique_ptr<char[]> _buffer;
+
+	/// The number of characters currently stored in the output buffer.
+	size_t _bufferSize = 0;
+
 	Q_OBJECT
 };
 
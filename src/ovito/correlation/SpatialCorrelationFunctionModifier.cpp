@@ -202,121 +202,70 @@ Future<AsynchronousModifier::ComputeEnginePtr> SpatialCorrelationFunctionModifie
 													   averagingDirection());
 }
 
+/******************************************************************************
+* Determines the grid cell each particle belongs to. The returned list is sorted
+* by grid cell, such that the grid is written in ascending memory order when
+* particle values are accumulated. Also computes the weight of each particle
+* for the optional window function along non-periodic directions.
+******************************************************************************/
+std::vector<SpatialCorrelationFunctionModifier::CorrelationAnalysisEngine::GridBin> SpatialCorrelationFunctionModifier::CorrelationAnalysisEngine::binParticlesOnGrid(const AffineTransformation& reciprocalCellMatrix, int nX, int nY, int nZ, bool applyWindow)
+{
+	// Get periodic boundary flag.
+	const std::array<bool, 3> pbc = cell().pbcFlags();
+
+	ConstPropertyAccess<Point3> positionsArray(positions());
+	std::vector<GridBin> gridBins;
+	gridBins.reserve(positionsArray.size());
+	size_t particleIndex = 0;
+	for(const Point3& pos : positionsArray) {
+		Point3 fractionalPos = reciprocalCellMatrix * pos;
+		int binIndexX = int( fractionalPos.x() * nX );
+		int binIndexY = int( fractionalPos.y() * nY );
+		int binIndexZ = int( fractionalPos.z() * nZ );
+		FloatType window = 1;
+		if(pbc[0]) binIndexX = SimulationCell::modulo(binIndexX, nX);
+		else if(applyWindow) window *= sqrt(2./3)*(1-cos(2*FLOATTYPE_PI*fractionalPos.x()));
+		if(pbc[1]) binIndexY = SimulationCell::modulo(binIndexY, nY);
+		else if(applyWindow) window *= sqrt(2./3)*(1-cos(2*FLOATTYPE_PI*fractionalPos.y()));
+		if(pbc[2]) binIndexZ = SimulationCell::modulo(binIndexZ, nZ);
+		else if(applyWindow) window *= sqrt(2./3)*(1-cos(2*FLOATTYPE_PI*fractionalPos.z()));
+		if(binIndexX >= 0 && binIndexX < nX && binIndexY >= 0 && binIndexY < nY && binIndexZ >= 0 && binIndexZ < nZ) {
+			// Store in row-major format.
+			size_t binIndex = binIndexZ+nZ*(binIndexY+nY*binIndexX);
+			gridBins.push_back({ particleIndex, binIndex, window });
+		}
+		particleIndex++;
+	}
+
+	std::sort(gridBins.begin(), gridBins.end(), [](const GridBin& a, const GridBin& b) {
+		return a.binIndex < b.binIndex || (a.binIndex == b.binIndex && a.particleIndex < b.particleIndex);
+	});
+	return gridBins;
+}
+
 /******************************************************************************
 * Map property onto grid.
 ******************************************************************************/
 std::vector<FloatType> SpatialCorrelationFunctionModifier::CorrelationAnalysisEngine::mapToSpatialGrid(const PropertyStorage* property,
 																			  size_t propertyVectorComponent,
-																			  const AffineTransformation& reciprocalCellMatrix,
-																			  int nX, int nY, int nZ,
-																			  bool applyWindow)
+																			  const std::vector<GridBin>& gridBins,
+																			  int nX, int nY, int nZ)
 {
-	size_t vecComponent = std::max(size_t(0), propertyVectorComponent);
-	size_t vecComponentCount = property ? property->componentCount() : 0;
 	int numberOfGridPoints = nX * nY * nZ;
 
 	// Alloocate real space grid.
 	std::vector<FloatType> gridData(numberOfGridPoints, 0);
 
-	// Get periodic boundary flag.
-	const std::array<bool, 3> pbc = cell().pbcFlags();
-
-	if(!property || property->size() > 0) {
-		ConstPropertyAccess<Point3> positionsArray(positions());
-		if(!property) {
-			for(const Point3& pos : positionsArray) {
-				Point3 fractionalPos = reciprocalCellMatrix * pos;
-				int binIndexX = int( fractionalPos.x() * nX );
-				int binIndexY = int( fractionalPos.y() * nY );
-				int binIndexZ = int( fractionalPos.z() * nZ );
-				FloatType window = 1;
-				if(pbc[0]) binIndexX = SimulationCell::modulo(binIndexX, nX);
-				else window *= sqrt(2./3)*(1-cos(2*FLOATTYPE_PI*fractionalPos.x()));
-				if(pbc[1]) binIndexY = SimulationCell::modulo(binIndexY, nY);
-				else window *= sqrt(2./3)*(1-cos(2*FLOATTYPE_PI*fractionalPos.y()));
-				if(pbc[2]) binIndexZ = SimulationCell::modulo(binIndexZ, nZ);
-				else window *= sqrt(2./3)*(1-cos(2*FLOATTYPE_PI*fractionalPos.z()));
-				if (!applyWindow) window = 1;
-				if(binIndexX >= 0 && binIndexX < nX && binIndexY >= 0 && binIndexY < nY && binIndexZ >= 0 && binIndexZ < nZ) {
-					// Store in row-major format.
-					size_t binIndex = binIndexZ+nZ*(binIndexY+nY*binIndexX);
-					gridData[binIndex] += window;
-				}
-			}
-		}
-		else if(property->dataType() == PropertyStorage::Float) {
-			ConstPropertyAccess<FloatType,true> propertyArray(*property);
-			const Point3* pos = positionsArray.cbegin();
-			for(FloatType v : propertyArray.componentRange(vecComponent)) {
-				if(!std::isnan(v)) {
-					Point3 fractionalPos = reciprocalCellMatrix * (*pos);
-					int binIndexX = int( fractionalPos.x() * nX );
-					int binIndexY = int( fractionalPos.y() * nY );
-					int binIndexZ = int( fractionalPos.z() * nZ );
-					FloatType window = 1;
-					if(pbc[0]) binIndexX = SimulationCell::modulo(binIndexX, nX);
-					else window *= sqrt(2./3)*(1-cos(2*FLOATTYPE_PI*fractionalPos.x()));
-					if(pbc[1]) binIndexY = SimulationCell::modulo(binIndexY, nY);
-					else window *= sqrt(2./3)*(1-cos(2*FLOATTYPE_PI*fractionalPos.y()));
-					if(pbc[2]) binIndexZ = SimulationCell::modulo(binIndexZ, nZ);
-					else window *= sqrt(2./3)*(1-cos(2*FLOATTYPE_PI*fractionalPos.z()));
-					if(!applyWindow) window = 1;
-					if(binIndexX >= 0 && binIndexX < nX && binIndexY >= 0 && binIndexY < nY && binIndexZ >= 0 && binIndexZ < nZ) {
-						// Store in row-major format.
-						size_t binIndex = binIndexZ+nZ*(binIndexY+nY*binIndexX);
-						gridData[binIndex] += window*(v);
-					}
-				}
-				++pos;
-			}
-		}
-		else if(property->dataType() == PropertyStorage::Int) {
-			ConstPropertyAccess<int,true> propertyArray(*property);
-			const Point3* pos = positionsArray.cbegin();
-			for(int v : propertyArray.componentRange(vecComponent)) {
-				Point3 fractionalPos = reciprocalCellMatrix * (*pos);
-				int binIndexX = int( fractionalPos.x() * nX );
-				int binIndexY = int( fractionalPos.y() * nY );
-				int binIndexZ = int( fractionalPos.z() * nZ );
-				FloatType window = 1;
-				if(pbc[0]) binIndexX = SimulationCell::modulo(binIndexX, nX);
-				else window *= sqrt(2./3)*(1-cos(2*FLOATTYPE_PI*fractionalPos.x()));
-				if(pbc[1]) binIndexY = SimulationCell::modulo(binIndexY, nY);
-				else window *= sqrt(2./3)*(1-cos(2*FLOATTYPE_PI*fractionalPos.y()));
-				if(pbc[2]) binIndexZ = SimulationCell::modulo(binIndexZ, nZ);
-				else window *= sqrt(2./3)*(1-cos(2*FLOATTYPE_PI*fractionalPos.z()));
-				if(!applyWindow) window = 1;
-				if(binIndexX >= 0 && binIndexX < nX && binIndexY >= 0 && binIndexY < nY && binIndexZ >= 0 && binIndexZ < nZ) {
-					// Store in row-major format.
-					size_t binIndex = binIndexZ+nZ*(binIndexY+nY*binIndexX);
-					gridData[binIndex] += window*(v);
-				}
-				++pos;
-			}
-		}
-		else if(property->dataType() == PropertyStorage::Int64) {
-			ConstPropertyAccess<qlonglong,true> propertyArray(*property);
-			const Point3* pos = positionsArray.cbegin();
-			for(qlonglong v : propertyArray.componentRange(vecComponent)) {
-				Point3 fractionalPos = reciprocalCellMatrix * (*pos);
-				int binIndexX = int( fractionalPos.x() * nX );
-				int binIndexY = int( fractionalPos.y() * nY );
-				int binIndexZ = int( fractionalPos.z() * nZ );
-				FloatType window = 1;
-				if(pbc[0]) binIndexX = SimulationCell::modulo(binIndexX, nX);
-				else window *= sqrt(2./3)*(1-cos(2*FLOATTYPE_PI*fractionalPos.x()));
-				if(pbc[1]) binIndexY = SimulationCell::modulo(binIndexY, nY);
-				else window *= sqrt(2./3)*(1-cos(2*FLOATTYPE_PI*fractionalPos.y()));
-				if(pbc[2]) binIndexZ = SimulationCell::modulo(binIndexZ, nZ);
-				else window *= sqrt(2./3)*(1-cos(2*FLOATTYPE_PI*fractionalPos.z()));
-				if(!applyWindow) window = 1;
-				if(binIndexX >= 0 && binIndexX < nX && binIndexY >= 0 && binIndexY < nY && binIndexZ >= 0 && binIndexZ < nZ) {
-					// Store in row-major format.
-					size_t binIndex = binIndexZ+nZ*(binIndexY+nY*binIndexX);
-					gridData[binIndex] += window*(v);
-				}
-				++pos;
-			}
+	if(!property) {
+		for(const GridBin& gridBin : gridBins)
+			gridData[gridBin.binIndex] += gridBin.window;
+	}
+	else if(property->size() > 0) {
+		std::vector<FloatType> values = extractPropertyComponent(property, propertyVectorComponent);
+		for(const GridBin& gridBin : gridBins) {
+			FloatType v = values[gridBin.particleIndex];
+			if(!std::isnan(v))
+				gridData[gridBin.binIndex] += gridBin.window*(v);
 		}
 	}
 	return gridData;
@@ -370,6 +319,140 @@ std::vector<FloatType> SpatialCorrelationFunctionModifier::CorrelationAnalysisEn
 	return rData;
 }
 
+#ifdef OVITO_DEBUG
+/******************************************************************************
+* Checks whether the results of two FFT calculations agree within the expected
+* rounding errors. The magnitude of the input grid is given by 'scale'.
+******************************************************************************/
+template<typename T>
+static bool fftResultsAgree(const std::vector<T>& a, const std::vector<T>& b, FloatType scale)
+{
+	if(a.size() != b.size()) return false;
+	FloatType tolerance = FloatType(1e3) * FLOATTYPE_EPSILON * scale * std::sqrt((FloatType)a.size());
+	for(size_t i = 0; i < a.size(); i++) {
+		if(std::abs(a[i] - b[i]) > tolerance)
+			return false;
+	}
+	return true;
+}
+#endif
+
+/******************************************************************************
+* Computes the Fourier transforms of two real-valued grids with a single complex
+* FFT of the combined grid a + i*b. The two transforms are separated using
+* their Hermitian symmetry:
+*   A[k] = (Z[k] + conj(Z[-k])) / 2,   B[k] = (Z[k] - conj(Z[-k])) / 2i
+* Both grids are normalized to unit magnitude before they get combined. Otherwise
+* the rounding errors of a grid with large values would swamp the transform of a
+* grid with small values.
+******************************************************************************/
+void SpatialCorrelationFunctionModifier::CorrelationAnalysisEngine::r2cFFT(int nX, int nY, int nZ, const std::vector<FloatType>& rData1, const std::vector<FloatType>& rData2, std::vector<std::complex<FloatType>>& cData1, std::vector<std::complex<FloatType>>& cData2)
+{
+	OVITO_ASSERT(nX * nY * nZ == rData1.size());
+	OVITO_ASSERT(nX * nY * nZ == rData2.size());
+
+	// Determine the magnitudes of the two grids.
+	FloatType scale1 = 0, scale2 = 0;
+	for(FloatType v : rData1) scale1 = std::max(scale1, std::abs(v));
+	for(FloatType v : rData2) scale2 = std::max(scale2, std::abs(v));
+	FloatType invScale1 = (scale1 != 0) ? (1 / scale1) : 0;
+	FloatType invScale2 = (scale2 != 0) ? (1 / scale2) : 0;
+
+	// Pack the two normalized real-valued grids into the real and imaginary parts of a single complex grid.
+	const int dims[3] = { nX, nY, nZ };
+	kiss_fftnd_cfg kiss = kiss_fftnd_alloc(dims, 3, false, 0, 0);
+	std::vector<kiss_fft_cpx> in(nX * nY * nZ);
+	auto rData1Iter = rData1.cbegin();
+	auto rData2Iter = rData2.cbegin();
+	for(kiss_fft_cpx& c : in) {
+		c.r = *rData1Iter++ * invScale1;
+		c.i = *rData2Iter++ * invScale2;
+	}
+
+	// Perform FFT calculation.
+	std::vector<std::complex<FloatType>> z(nX * nY * nZ);
+	OVITO_STATIC_ASSERT(sizeof(kiss_fft_cpx) == sizeof(std::complex<FloatType>));
+	kiss_fftnd(kiss, in.data(), reinterpret_cast<kiss_fft_cpx*>(z.data()));
+	kiss_fft_free(kiss);
+
+	// Separate the two transforms and undo the normalization.
+	cData1.resize(nX * nY * nZ);
+	cData2.resize(nX * nY * nZ);
+	int binIndex = 0;
+	for(int binIndexX = 0; binIndexX < nX; binIndexX++) {
+		int negIndexX = (nX - binIndexX) % nX;
+		for(int binIndexY = 0; binIndexY < nY; binIndexY++) {
+			int negIndexY = (nY - binIndexY) % nY;
+			for(int binIndexZ = 0; binIndexZ < nZ; binIndexZ++, binIndex++) {
+				int negIndexZ = (nZ - binIndexZ) % nZ;
+				const std::complex<FloatType>& zk = z[binIndex];
+				std::complex<FloatType> zmk = std::conj(z[negIndexZ + nZ*(negIndexY + nY*negIndexX)]);
+				cData1[binIndex] = (zk + zmk) * (FloatType(0.5) * scale1);
+				cData2[binIndex] = (zk - zmk) * std::complex<FloatType>(0, FloatType(-0.5) * scale2);
+			}
+		}
+	}
+
+#ifdef OVITO_DEBUG
+	// Compare with the results of two separate transforms.
+	std::vector<FloatType> rData1Copy = rData1;
+	std::vector<FloatType> rData2Copy = rData2;
+	OVITO_ASSERT(fftResultsAgree(cData1, r2cFFT(nX, nY, nZ, rData1Copy), scale1));
+	OVITO_ASSERT(fftResultsAgree(cData2, r2cFFT(nX, nY, nZ, rData2Copy), scale2));
+#endif
+}
+
+/******************************************************************************
+* Computes the inverse Fourier transforms of two Hermitian grids with a single
+* complex FFT. Since the inverse transforms a and b are real-valued, they are
+* the real and imaginary parts of the inverse transform of A + i*B.
+* As in the forward case, both grids are normalized before they get combined.
+******************************************************************************/
+void SpatialCorrelationFunctionModifier::CorrelationAnalysisEngine::c2rFFT(int nX, int nY, int nZ, const std::vector<std::complex<FloatType>>& cData1, const std::vector<std::complex<FloatType>>& cData2, std::vector<FloatType>& rData1, std::vector<FloatType>& rData2)
+{
+	OVITO_ASSERT(nX * nY * nZ == cData1.size());
+	OVITO_ASSERT(nX * nY * nZ == cData2.size());
+
+	const int dims[3] = { nX, nY, nZ };
+	kiss_fftnd_cfg kiss = kiss_fftnd_alloc(dims, 3, true, 0, 0);
+	std::vector<std::complex<FloatType>> in(nX * nY * nZ);
+	std::vector<kiss_fft_cpx> out(nX * nY * nZ);
+	OVITO_STATIC_ASSERT(sizeof(kiss_fft_cpx) == sizeof(std::complex<FloatType>));
+
+	// Determine the magnitudes of the two grids.
+	FloatType scale1 = 0, scale2 = 0;
+	for(const std::complex<FloatType>& c : cData1) scale1 = std::max(scale1, std::abs(c));
+	for(const std::complex<FloatType>& c : cData2) scale2 = std::max(scale2, std::abs(c));
+	FloatType invScale1 = (scale1 != 0) ? (1 / scale1) : 0;
+	FloatType invScale2 = (scale2 != 0) ? (1 / scale2) : 0;
+
+	// Combine the two normalized grids.
+	for(size_t i = 0; i < in.size(); i++)
+		in[i] = cData1[i] * invScale1 + std::complex<FloatType>(0, invScale2) * cData2[i];
+
+	// Perform FFT calculation.
+	kiss_fftnd(kiss, reinterpret_cast<const kiss_fft_cpx*>(in.data()), out.data());
+	kiss_fft_free(kiss);
+
+	// Split complex values into the two real-valued grids and undo the normalization.
+	rData1.resize(nX * nY * nZ);
+	rData2.resize(nX * nY * nZ);
+	auto rData1Iter = rData1.begin();
+	auto rData2Iter = rData2.begin();
+	for(const kiss_fft_cpx& c : out) {
+		*rData1Iter++ = c.r * scale1;
+		*rData2Iter++ = c.i * scale2;
+	}
+
+#ifdef OVITO_DEBUG
+	// Compare with the results of two separate transforms.
+	std::vector<std::complex<FloatType>> cData1Copy = cData1;
+	std::vector<std::complex<FloatType>> cData2Copy = cData2;
+	OVITO_ASSERT(fftResultsAgree(rData1, c2rFFT(nX, nY, nZ, cData1Copy), scale1));
+	OVITO_ASSERT(fftResultsAgree(rData2, c2rFFT(nX, nY, nZ, cData2Copy), scale2));
+#endif
+}
+
 /******************************************************************************
 * Compute real and reciprocal space correlation function via FFT.
 ******************************************************************************/
@@ -384,12 +467,14 @@ void SpatialCorrelationFunctionModifier::CorrelationAnalysisEngine::computeFftCo
 	int nY = std::max(1, (int)(cellMatrix.column(1).length() / fftGridSpacing()));
 	int nZ = std::max(1, (int)(cellMatrix.column(2).length() / fftGridSpacing()));
 
+	// Determine the grid cells and window weights of all particles once. They are shared by all grids.
+	std::vector<GridBin> gridBins = binParticlesOnGrid(reciprocalCellMatrix, nX, nY, nZ, _applyWindow);
+
 	// Map all quantities onto a spatial grid.
 	std::vector<FloatType> gridProperty1 = mapToSpatialGrid(sourceProperty1().get(),
 					 _vecComponent1,
-					 reciprocalCellMatrix,
-					 nX, nY, nZ,
-					 _applyWindow);
+					 gridBins,
+					 nX, nY, nZ);
 
 	nextProgressSubStep();
 	if(isCanceled())
@@ -397,18 +482,16 @@ void SpatialCorrelationFunctionModifier::CorrelationAnalysisEngine::computeFftCo
 
 	std::vector<FloatType> gridProperty2 = mapToSpatialGrid(sourceProperty2().get(),
 					 _vecComponent2,
-					 reciprocalCellMatrix,
-					 nX, nY, nZ,
-					 _applyWindow);
+					 gridBins,
+					 nX, nY, nZ);
 	nextProgressSubStep();
 	if(isCanceled())
 		return;
 
 	std::vector<FloatType> gridDensity = mapToSpatialGrid(nullptr,
 					 _vecComponent1,
-					 reciprocalCellMatrix,
-					 nX, nY, nZ,
-					 _applyWindow);
+					 gridBins,
+					 nX, nY, nZ);
 	nextProgressSubStep();
 	if(isCanceled())
 		return;
@@ -418,12 +501,9 @@ void SpatialCorrelationFunctionModifier::CorrelationAnalysisEngine::computeFftCo
 	// Compute reciprocal-space correlation function from a product in Fourier space.
 
 	// Compute Fourier transform of spatial grid.
-	std::vector<std::complex<FloatType>> ftProperty1 = r2cFFT(nX, nY, nZ, gridProperty1);
-	nextProgressSubStep();
-	if(isCanceled())
-		return;
-
-	std::vector<std::complex<FloatType>> ftProperty2 = r2cFFT(nX, nY, nZ, gridProperty2);
+	// The transforms of the two property grids are obtained from a single complex FFT.
+	std::vector<std::complex<FloatType>> ftProperty1, ftProperty2;
+	r2cFFT(nX, nY, nZ, gridProperty1, gridProperty2, ftProperty1, ftProperty2);
 	nextProgressSubStep();
 	if(isCanceled())
 		return;
@@ -525,13 +605,9 @@ void SpatialCorrelationFunctionModifier::CorrelationAnalysisEngine::computeFftCo
 
 	// Compute long-ranged part of the real-space correlation function from the FFT convolution.
 
-	// Computer inverse Fourier transform of correlation function.
-	gridProperty1 = c2rFFT(nX, nY, nZ, ftProperty1);
-	nextProgressSubStep();
-	if(isCanceled())
-		return;
-
-	gridDensity = c2rFFT(nX, nY, nZ, ftDensity);
+	// Computer inverse Fourier transform of correlation function and structure factor.
+	// Both are Hermitian, so their inverse transforms are obtained from a single complex FFT.
+	c2rFFT(nX, nY, nZ, ftProperty1, ftDensity, gridProperty1, gridDensity);
 	nextProgressSubStep();
 	if(isCanceled())
 		return;
@@ -539,6 +615,7 @@ void SpatialCorrelationFunctionModifier::CorrelationAnalysisEngine::computeFftCo
 	// Determine number of grid points for reciprocal-spacespace correlation function.
 	int numberOfDistanceBins = minCellFaceDistance / (2 * fftGridSpacing());
 	FloatType gridSpacing = minCellFaceDistance / (2 * numberOfDistanceBins);
+	FloatType inverseGridSpacing = 1 / gridSpacing;
 
 	// Radially averaged real space correlation function.
 	_realSpaceCorrelation = std::make_shared<PropertyStorage>(numberOfDistanceBins, PropertyStorage::Float, 1, 0, tr("C(r)"), true, DataTable::YProperty);
@@ -568,7 +645,7 @@ void SpatialCorrelationFunctionModifier::CorrelationAnalysisEngine::computeFftCo
 						 		   fracZ*cellMatrix.column(2);
 
 				// Length of real space vector.
-				int distanceBinIndex = int(std::floor(distance.length()/gridSpacing));
+				int distanceBinIndex = int(std::floor(distance.length() * inverseGridSpacing));
 				if(distanceBinIndex >= 0 && distanceBinIndex < numberOfDistanceBins) {
 					realSpaceCorrelationData[distanceBinIndex] += gridProperty1[binIndex];
 					realSpaceRDFData[distanceBinIndex] += gridDensity[binIndex];
@@ -591,6 +668,31 @@ void SpatialCorrelationFunctionModifier::CorrelationAnalysisEngine::computeFftCo
 	nextProgressSubStep();
 }
 
+/******************************************************************************
+* Copies one vector component of a particle property into a contiguous array
+* of floating-point values.
+******************************************************************************/
+std::vector<FloatType> SpatialCorrelationFunctionModifier::CorrelationAnalysisEngine::extractPropertyComponent(const PropertyStorage* property, size_t vecComponent)
+{
+	std::vector<FloatType> values(property->size(), 0);
+	if(property->dataType() == PropertyStorage::Float) {
+		ConstPropertyAccess<FloatType,true> propertyArray(*property);
+		auto range = propertyArray.componentRange(vecComponent);
+		std::copy(range.begin(), range.end(), values.begin());
+	}
+	else if(property->dataType() == PropertyStorage::Int) {
+		ConstPropertyAccess<int,true> propertyArray(*property);
+		auto range = propertyArray.componentRange(vecComponent);
+		std::copy(range.begin(), range.end(), values.begin());
+	}
+	else if(property->dataType() == PropertyStorage::Int64) {
+		ConstPropertyAccess<qlonglong,true> propertyArray(*property);
+		auto range = propertyArray.componentRange(vecComponent);
+		std::copy(range.begin(), range.end(), values.begin());
+	}
+	return values;
+}
+
 /******************************************************************************
 * Compute real space correlation function via direction summation over neighbors.
 ******************************************************************************/
@@ -599,31 +701,10 @@ void SpatialCorrelationFunctionModifier::CorrelationAnalysisEngine::computeNeigh
 	// Get number of particles.
 	size_t particleCount = positions()->size();
 
-	// Get pointers to data.
-	ConstPropertyAccess<FloatType,true> floatData1;
-	ConstPropertyAccess<FloatType,true> floatData2;
-	ConstPropertyAccess<int,true> intData1;
-	ConstPropertyAccess<int,true> intData2;
-	ConstPropertyAccess<qlonglong,true> int64Data1;
-	ConstPropertyAccess<qlonglong,true> int64Data2;
-	if(sourceProperty1()->dataType() == PropertyStorage::Float) {
-		floatData1 = sourceProperty1();
-	}
-	else if(sourceProperty1()->dataType() == PropertyStorage::Int) {
-		intData1 = sourceProperty1();
-	}
-	else if(sourceProperty1()->dataType() == PropertyStorage::Int64) {
-		int64Data1 = sourceProperty1();
-	}
-	if(sourceProperty2()->dataType() == PropertyStorage::Float) {
-		floatData2 = sourceProperty2();
-	}
-	else if(sourceProperty2()->dataType() == PropertyStorage::Int) {
-		intData2 = sourceProperty2();
-	}
-	else if(sourceProperty2()->dataType() == PropertyStorage::Int64) {
-		int64Data2 = sourceProperty2();
-	}
+	// Copy the selected property components into contiguous arrays, which avoids
+	// a data type dispatch and a strided memory access for every particle pair.
+	std::vector<FloatType> values1 = extractPropertyComponent(sourceProperty1().get(), _vecComponent1);
+	std::vector<FloatType> values2 = extractPropertyComponent(sourceProperty2().get(), _vecComponent2);
 
 	// Allocate neighbor RDF.
 	_neighRDF = std::make_shared<PropertyStorage>(neighCorrelation()->size(), PropertyStorage::Float, 1, 0, tr("Neighbor g(r)"), true, DataTable::YProperty);
@@ -634,30 +715,21 @@ void SpatialCorrelationFunctionModifier::CorrelationAnalysisEngine::computeNeigh
 		return;
 
 	// Perform analysis on each particle in parallel.
-	size_t vecComponent1 = _vecComponent1;
-	size_t vecComponent2 = _vecComponent2;
 	setProgressValue(0);
 	setProgressMaximum(particleCount);
 	std::mutex mutex;
 	parallelForChunks(particleCount, *this, [&,this](size_t startIndex, size_t chunkSize, Task& promise) {
-		FloatType gridSpacing = (neighCutoff() + FLOATTYPE_EPSILON) / neighCorrelation()->size();
+		// Each pair distance is mapped directly to its histogram bin using the precomputed inverse bin width.
+		FloatType inverseGridSpacing = neighCorrelation()->size() / (neighCutoff() + FLOATTYPE_EPSILON);
 		std::vector<FloatType> threadLocalCorrelation(neighCorrelation()->size(), 0);
 		std::vector<int> threadLocalRDF(neighCorrelation()->size(), 0);
 		size_t endIndex = startIndex + chunkSize;
 		for(size_t i = startIndex; i < endIndex; i++) {
-			FloatType data1;
-			if(floatData1) data1 = floatData1.get(i, vecComponent1);
-			else if(intData1) data1 = intData1.get(i, vecComponent1);
-			else if(int64Data1) data1 = int64Data1.get(i, vecComponent1);
-			else data1 = 0;
+			FloatType data1 = values1[i];
 			for(CutoffNeighborFinder::Query neighQuery(neighborListBuilder, i); !neighQuery.atEnd(); neighQuery.next()) {
-				size_t distanceBinIndex = (size_t)(sqrt(neighQuery.distanceSquared()) / gridSpacing);
+				size_t distanceBinIndex = (size_t)(sqrt(neighQuery.distanceSquared()) * inverseGridSpacing);
 				distanceBinIndex = std::min(distanceBinIndex, threadLocalCorrelation.size() - 1);
-				FloatType data2;
-				if(floatData2) data2 = floatData2.get(neighQuery.current(), vecComponent2);
-				else if(intData2) data2 = intData2.get(neighQuery.current(), vecComponent2);
-				else if(int64Data2) data2 = int64Data2.get(neighQuery.current(), vecComponent2);
-				else data2 = 0;
+				FloatType data2 = values2[neighQuery.current()];
 				threadLocalCorrelation[distanceBinIndex] += data1 * data2;
 				threadLocalRDF[distanceBinIndex]++;
 			}
@@ -766,7 +838,7 @@ void SpatialCorrelationFunctionModifier::CorrelationAnalysisEngine::computeLimit
 void SpatialCorrelationFunctionModifier::CorrelationAnalysisEngine::perform()
 {
 	setProgressText(tr("Computing correlation function"));
-	beginProgressSubSteps(neighCorrelation() ? 13 : 11);
+	beginProgressSubSteps(neighCorrelation() ? 11 : 9);
 
 	// Compute reciprocal space correlation function and long-ranged part of
 	// the real-space correlation function from an FFT.
@@ -221,12 +221,30 @@ private:
 		/// Complex-to-real inverse FFT
 		std::vector<FloatType> c2rFFT(int nX, int nY, int nZ, std::vector<std::complex<FloatType>>& cData);
 
+		/// Real-to-complex FFT of two real-valued grids, which is performed as a single complex FFT.
+		void r2cFFT(int nX, int nY, int nZ, const std::vector<FloatType>& rData1, const std::vector<FloatType>& rData2, std::vector<std::complex<FloatType>>& cData1, std::vector<std::complex<FloatType>>& cData2);
+
+		/// Complex-to-real inverse FFT of two Hermitian grids, which is performed as a single complex FFT.
+		void c2rFFT(int nX, int nY, int nZ, const std::vector<std::complex<FloatType>>& cData1, const std::vector<std::complex<FloatType>>& cData2, std::vector<FloatType>& rData1, std::vector<FloatType>& rData2);
+
+		/// Copies one vector component of a particle property into a contiguous array of floating-point values.
+		static std::vector<FloatType> extractPropertyComponent(const PropertyStorage* property, size_t vecComponent);
+
+		/// Assignment of a particle to a cell of the real-space grid.
+		struct GridBin {
+			size_t particleIndex;
+			size_t binIndex;
+			FloatType window;	///< Weight of the particle due to the window function.
+		};
+
+		/// Determines the grid cells and window weights of all particles and sorts the particles by grid cell.
+		std::vector<GridBin> binParticlesOnGrid(const AffineTransformation& reciprocalCell, int nX, int nY, int nZ, bool applyWindow);
+
 		/// Map property onto grid.
 		std::vector<FloatType>  mapToSpatialGrid(const PropertyStorage* property,
 							  size_t propertyVectorComponent,
-							  const AffineTransformation& reciprocalCell,
-							  int nX, int nY, int nZ,
-							  bool applyWindow);
+							  const std::vector<GridBin>& gridBins,
+							  int nX, int nY, int nZ);
 
 		const size_t _vecComponent1;
 		const size_t _vecComponent2;
@@ -55,6 +55,9 @@ bool CAExporter::openOutputFile(const QString& filePath, int numberOfFrames, Syn
  *****************************************************************************/
 void CAExporter::closeOutputFile(bool exportCompleted)
 {
+	// Write any buffered text to the output file.
+	if(_outputStream && exportCompleted)
+		_outputStream->flush();
 	_outputStream.reset();
 	if(_outputFile.isOpen())
 		_outputFile.close();
@@ -53,6 +53,9 @@ bool VTKDislocationsExporter::openOutputFile(const QString& filePath, int number
  *****************************************************************************/
 void VTKDislocationsExporter::closeOutputFile(bool exportCompleted)
 {
+	// Write any buffered text to the output file.
+	if(_outputStream && exportCompleted)
+		_outputStream->flush();
 	_outputStream.reset();
 	if(_outputFile.isOpen())
 		_outputFile.close();
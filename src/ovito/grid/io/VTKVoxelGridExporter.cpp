@@ -50,6 +50,9 @@ bool VTKVoxelGridExporter::openOutputFile(const QString& filePath, int numberOfF
  *****************************************************************************/
 void VTKVoxelGridExporter::closeOutputFile(bool exportCompleted)
 {
+	// Write any buffered text to the output file.
+	if(_outputStream && exportCompleted)
+		_outputStream->flush();
 	_outputStream.reset();
 	if(_outputFile.isOpen())
 		_outputFile.close();
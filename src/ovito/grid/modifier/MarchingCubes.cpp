@@ -41,6 +41,7 @@ MarchingCubes::MarchingCubes(SurfaceMeshData& outputMesh, int size_x, int size_y
     _data(data),
     _dataStride(stride),
     _cubeVerts(_size_x * _size_y * _size_z * 3, HalfEdgeMesh::InvalidIndex),
+    _rowTrimBounds(_size_y * _size_z, std::make_pair(_size_x, 0)),
     _lowerIsSolid(lowerIsSolid)
 {
     OVITO_ASSERT(stride >= 1);
@@ -61,8 +62,25 @@ bool MarchingCubes::generateIsosurface(FloatType isolevel, Task& task)
     if(task.isCanceled()) return false;
 
     for(int k = 0; k < _size_z && !task.isCanceled(); k++, task.incrementProgressValue()) {
+        int k1 = (k + 1 == _size_z) ? 0 : (k + 1);
         for(int j = 0; j < _size_y; j++) {
-            for(int i = 0; i < _size_x; i++) {
+            int j1 = (j + 1 == _size_y) ? 0 : (j + 1);
+
+            // A cube can only intersect the isosurface if one of its edges does.
+            // The edges of the cubes in this row originate from four rows of grid points.
+            // Restrict the loop to the range of cubes that touch an intersected edge.
+            const std::pair<int,int>& b1 = _rowTrimBounds[j  + k  * _size_y];
+            const std::pair<int,int>& b2 = _rowTrimBounds[j1 + k  * _size_y];
+            const std::pair<int,int>& b3 = _rowTrimBounds[j  + k1 * _size_y];
+            const std::pair<int,int>& b4 = _rowTrimBounds[j1 + k1 * _size_y];
+            int xmin = std::min({b1.first, b2.first, b3.first, b4.first});
+            int xmax = std::max({b1.second, b2.second, b3.second, b4.second});
+            if(xmin >= xmax) continue;
+            // Edges starting at x=0 are also shared by the last cube of the row due to the periodic wrap-around.
+            int iEnd = (xmin == 0) ? _size_x : xmax;
+            int iBegin = std::max(xmin - 1, 0);
+
+            for(int i = iBegin; i < iEnd; i++) {
                 _lut_entry = 0;
                 for(int p = 0; p < 8; ++p) {
                     _cube[p] = getFieldValue(i+((p^(p>>1))&1), j+((p>>1)&1), k+((p>>2)&1)) - isolevel;
@@ -103,9 +121,17 @@ void MarchingCubes::computeIntersectionPoints(FloatType isolevel, Task& task)
                 else {
                     if(cube[0] < 0) _outputMesh.setSpaceFillingRegion(HalfEdgeMesh::InvalidIndex);
                 }
-                if(cube[1]*cube[0] < 0) createEdgeVertexX(i,j,k, cube[0] / (cube[0] - cube[1]));
-                if(cube[3]*cube[0] < 0) createEdgeVertexY(i,j,k, cube[0] / (cube[0] - cube[3]));
-                if(cube[4]*cube[0] < 0) createEdgeVertexZ(i,j,k, cube[0] / (cube[0] - cube[4]));
+                bool intersected = false;
+                if(cube[1]*cube[0] < 0) { createEdgeVertexX(i,j,k, cube[0] / (cube[0] - cube[1])); intersected = true; }
+                if(cube[3]*cube[0] < 0) { createEdgeVertexY(i,j,k, cube[0] / (cube[0] - cube[3])); intersected = true; }
+                if(cube[4]*cube[0] < 0) { createEdgeVertexZ(i,j,k, cube[0] / (cube[0] - cube[4])); intersected = true; }
+
+                // Keep track of the range of intersected edges in each row of grid points.
+                if(intersected) {
+                    std::pair<int,int>& bounds = _rowTrimBounds[j + k * _size_y];
+                    if(i < bounds.first) bounds.first = i;
+                    bounds.second = i + 1;
+                }
             }
         }
     }
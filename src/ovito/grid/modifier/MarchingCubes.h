@@ -154,6 +154,10 @@ private:
     /// Vertices created along cube edges.
     std::vector<HalfEdgeMesh::vertex_index> _cubeVerts;
 
+    /// For each row of grid points along the x-axis, the range [first, second) of x-indices
+    /// from which intersected edges originate. Used to skip cubes that cannot contain a part of the surface.
+    std::vector<std::pair<int,int>> _rowTrimBounds;
+
     FloatType     _cube[8];   ///< values of the implicit function on the active cube
     unsigned char _lut_entry; ///< cube sign representation in [0..255]
     unsigned char _case;      ///< case of the active cube in [0..15]
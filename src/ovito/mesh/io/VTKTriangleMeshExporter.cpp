@@ -50,6 +50,9 @@ bool VTKTriangleMeshExporter::openOutputFile(const QString& filePath, int number
  *****************************************************************************/
 void VTKTriangleMeshExporter::closeOutputFile(bool exportCompleted)
 {
+	// Write any buffered text to the output file.
+	if(_outputStream && exportCompleted)
+		_outputStream->flush();
 	_outputStream.reset();
 	if(_outputFile.isOpen())
 		_outputFile.close();
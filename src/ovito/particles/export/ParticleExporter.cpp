@@ -85,6 +85,9 @@ bool ParticleExporter::openOutputFile(const QString& filePath, int numberOfFrame
  *****************************************************************************/
 void ParticleExporter::closeOutputFile(bool exportCompleted)
 {
+	// Write any buffered text to the output file.
+	if(_outputStream && exportCompleted)
+		_outputStream->flush();
 	_outputStream.reset();
 	if(_outputFile.isOpen())
 		_outputFile.close();
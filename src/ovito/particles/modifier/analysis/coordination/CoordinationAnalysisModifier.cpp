@@ -133,7 +133,23 @@ void CoordinationAnalysisModifier::CoordinationAnalysisEngine::perform()
 		size_t binCount = rdfY()->size();
 		size_t rdfCount = rdfY()->componentCount();
 		FloatType rdfBinSize = cutoff() / binCount;
-		std::vector<size_t> threadLocalRDF(binCount * rdfCount, 0);
+
+		// Per-thread histograms use 32-bit counters to keep their cache footprint small.
+		// They get flushed into the master histograms before the counters can overflow.
+		std::vector<quint32> threadLocalRDF(binCount * rdfCount, 0);
+		size_t threadLocalPairCount = 0;
+
+		// Combines the per-thread RDFs into the set of master histograms.
+		auto flushThreadLocalRDF = [&]() {
+			std::lock_guard<std::mutex> lock(mutex);
+			PropertyAccess<FloatType,true> rdfData(rdfY());
+			auto bin = rdfData.begin();
+			for(auto iter = threadLocalRDF.cbegin(); iter != threadLocalRDF.cend(); ++iter)
+				*bin++ += *iter;
+			std::fill(threadLocalRDF.begin(), threadLocalRDF.end(), 0);
+			threadLocalPairCount = 0;
+		};
+
 		for(size_t i = startIndex, endIndex = startIndex + chunkSize; i < endIndex; ) {
 			int& coordination = coordinationData[i];
 			OVITO_ASSERT(coordination == 0);
@@ -142,6 +158,7 @@ void CoordinationAnalysisModifier::CoordinationAnalysisEngine::perform()
 			if(typeIndex1 < typeCount) {
 				for(CutoffNeighborFinder::Query neighQuery(neighborListBuilder, i); !neighQuery.atEnd(); neighQuery.next()) {
 					coordination++;
+					threadLocalPairCount++;
 					if(_computePartialRdfs) {
 						size_t typeIndex2 = uniqueTypeIds().index_of(uniqueTypeIds().find(particleTypeData[neighQuery.current()]));
 						if(typeIndex2 < typeCount) {
@@ -161,6 +178,9 @@ void CoordinationAnalysisModifier::CoordinationAnalysisEngine::perform()
 			}
 			i++;
 
+			if(threadLocalPairCount > std::numeric_limits<quint32>::max() / 2)
+				flushThreadLocalRDF();
+
 			// Update progress indicator.
 			if((i % 1024ll) == 0)
 				promise.incrementProgressValue(1024);
@@ -169,11 +189,7 @@ void CoordinationAnalysisModifier::CoordinationAnalysisEngine::perform()
 				return;
 		}
 		// Combine per-thread RDFs into a set of master histograms.
-		std::lock_guard<std::mutex> lock(mutex);
-		PropertyAccess<FloatType,true> rdfData(rdfY());
-		auto bin = rdfData.begin();
-		for(auto iter = threadLocalRDF.cbegin(); iter != threadLocalRDF.cend(); ++iter)
-			*bin++ += *iter;
+		flushThreadLocalRDF();
 	});
 	if(isCanceled())
 		return;
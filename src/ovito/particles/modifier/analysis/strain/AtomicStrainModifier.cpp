@@ -172,6 +172,10 @@ void AtomicStrainModifier::AtomicStrainEngine::perform()
 		Matrix_3<double> W = Matrix_3<double>::Zero();
 		int numNeighbors = 0;
 
+		// Neighbor vectors in the reference and current configuration, which are needed again
+		// for calculating the nonaffine displacement once the deformation gradient is known.
+		QVarLengthArray<std::pair<Vector3,Vector3>, 64> neighborVectors;
+
 		// Iterate over neighbors of central particle.
 		size_t particleIndexReference = currentToRefIndexMap()[particleIndex];
 		FloatType sumSquaredDistance = 0;
@@ -197,6 +201,8 @@ void AtomicStrainModifier::AtomicStrainEngine::perform()
 					}
 				}
 				sumSquaredDistance += delta_ref.squaredLength();
+				if(nonaffineSquaredDisplacementsArray)
+					neighborVectors.append(std::make_pair(delta_ref, delta_cur));
 				numNeighbors++;
 			}
 		}
@@ -267,29 +273,12 @@ void AtomicStrainModifier::AtomicStrainEngine::perform()
 		if(strainTensorsArray)
 			strainTensorsArray[particleIndex] = (SymmetricTensor2)strain;
 
-		// Calculate nonaffine displacement.
+		// Calculate nonaffine displacement from the neighbor vectors recorded above.
 		if(nonaffineSquaredDisplacementsArray) {
 			FloatType D2min = 0;
 			Matrix3 Fftype = static_cast<Matrix3>(F);
-
-			// Again iterate over neighbor vectors of central particle.
-			numNeighbors = 0;
-			const Vector3& center_displacement = displacementsArray[particleIndexReference];
-			for(CutoffNeighborFinder::Query neighQuery(neighborFinder, particleIndexReference); !neighQuery.atEnd(); neighQuery.next()) {
-				size_t neighborIndexCurrent = refToCurrentIndexMap()[neighQuery.current()];
-				if(neighborIndexCurrent == std::numeric_limits<size_t>::max()) continue;
-				const Vector3& neigh_displacement = displacementsArray[neighQuery.current()];
-				Vector3 delta_ref = neighQuery.delta();
-				Vector3 delta_cur = delta_ref + neigh_displacement - center_displacement;
-				if(affineMapping() == TO_CURRENT_CELL) {
-					delta_ref = refToCurTM() * delta_ref;
-					delta_cur = refToCurTM() * delta_cur;
-				}
-				else if(affineMapping() != TO_REFERENCE_CELL) {
-					delta_cur = refToCurTM() * delta_cur;
-				}
-				D2min += (Fftype * delta_ref - delta_cur).squaredLength();
-			}
+			for(const auto& delta : neighborVectors)
+				D2min += (Fftype * delta.first - delta.second).squaredLength();
 
 			nonaffineSquaredDisplacementsArray[particleIndex] = D2min;
 		}
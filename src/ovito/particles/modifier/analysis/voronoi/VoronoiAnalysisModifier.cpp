@@ -218,11 +218,6 @@ void VoronoiAnalysisModifier::VoronoiAnalysisEngine::perform()
 		double vol = v.volume();
 		atomicVolumesArray[index] = (FloatType)vol;
 
-		// Accumulate total volume of Voronoi cells.
-		// Loop is for lock-free write access to shared max counter.
-		double prevVolumeSum = voronoiVolumeSum();
-		while(!voronoiVolumeSum().compare_exchange_weak(prevVolumeSum, prevVolumeSum + vol));
-
 		// Compute total surface area of Voronoi cell when relative area threshold is used to
 		// filter out small faces.
 		double faceAreaThreshold = _faceThreshold;
@@ -534,6 +529,20 @@ void VoronoiAnalysisModifier::VoronoiAnalysisEngine::perform()
 		if(isCanceled()) return;
 	}
 
+	// Compute total volume of the Voronoi cells. Use a compensated summation (Neumaier's algorithm)
+	// to keep the result independent of rounding errors accumulating over many cells.
+	double volumeSum = 0;
+	double volumeCompensation = 0;
+	for(double vol : atomicVolumesArray) {
+		double t = volumeSum + vol;
+		if(std::abs(volumeSum) >= std::abs(vol))
+			volumeCompensation += (volumeSum - t) + vol;
+		else
+			volumeCompensation += (vol - t) + volumeSum;
+		volumeSum = t;
+	}
+	_voronoiVolumeSum = volumeSum + volumeCompensation;
+
 	if(maxFaceOrders()) {
 		size_t componentCount = std::min(_maxFaceOrder.load(), FaceOrderStorageLimit);
 		_voronoiIndices = std::make_shared<PropertyStorage>(_positions->size(), PropertyStorage::Int, componentCount, 0, QStringLiteral("Voronoi Index"), true);
@@ -116,7 +116,7 @@ private:
 		const PropertyPtr& maxFaceOrders() const { return _maxFaceOrders; }
 
 		/// Returns the volume sum of all Voronoi cells computed by the modifier.
-		std::atomic<double>& voronoiVolumeSum() { return _voronoiVolumeSum; }
+		double voronoiVolumeSum() const { return _voronoiVolumeSum; }
 
 		/// Returns the maximum number of edges of any Voronoi face.
 		std::atomic<int>& maxFaceOrder() { return _maxFaceOrder; }
@@ -155,7 +155,7 @@ private:
 		ParticleOrderingFingerprint _inputFingerprint;
 
 		/// The volume sum of all Voronoi cells.
-		std::atomic<double> _voronoiVolumeSum{0.0};
+		double _voronoiVolumeSum = 0;
 
 		/// The maximum number of edges of a Voronoi face.
 		std::atomic<int> _maxFaceOrder{0};
@@ -235,50 +235,58 @@ void CreateBondsModifier::BondsEngine::perform()
 	ConstPropertyAccess<int> particleTypesArray(_particleTypes);
 
 	// Generate bonds.
+	// The particles are processed in parallel. Each thread collects the bonds it finds in
+	// a local list, and the lists are concatenated in the order of the particle chunks at the end.
 	size_t particleCount = _positions->size();
 	setProgressMaximum(particleCount);
-	if(!particleTypesArray) {
-		for(size_t particleIndex = 0; particleIndex < particleCount; particleIndex++) {
+	std::vector<std::pair<size_t, std::vector<Bond>>> chunkBonds;
+	std::mutex mutex;
+	parallelForChunks(particleCount, *this, [&](size_t startIndex, size_t chunkSize, Task& promise) {
+		std::vector<Bond> threadLocalBonds;
+		for(size_t particleIndex = startIndex, endIndex = startIndex + chunkSize; particleIndex < endIndex; ) {
+			int type1 = particleTypesArray ? particleTypesArray[particleIndex] : -1;
 			for(CutoffNeighborFinder::Query neighborQuery(neighborFinder, particleIndex); !neighborQuery.atEnd(); neighborQuery.next()) {
 				if(neighborQuery.distanceSquared() < minCutoffSquared)
 					continue;
 				if(moleculeIDsArray && moleculeIDsArray[particleIndex] != moleculeIDsArray[neighborQuery.current()])
 					continue;
+				if(particleTypesArray) {
+					int type2 = particleTypesArray[neighborQuery.current()];
+					if(type1 < 0 || type1 >= (int)_pairCutoffsSquared.size() || type2 < 0 || type2 >= (int)_pairCutoffsSquared[type1].size())
+						continue;
+					if(neighborQuery.distanceSquared() > _pairCutoffsSquared[type1][type2])
+						continue;
+				}
 
 				Bond bond = { particleIndex, neighborQuery.current(), neighborQuery.unwrappedPbcShift() };
 
 				// Skip every other bond to create only one bond per particle pair.
 				if(!bond.isOdd())
-					bonds().push_back(bond);
-			}
-			// Update progress indicator.
-			if(!setProgressValueIntermittent(particleIndex))
-				return;
-		}
-	}
-	else {
-		for(size_t particleIndex = 0; particleIndex < particleCount; particleIndex++) {
-			for(CutoffNeighborFinder::Query neighborQuery(neighborFinder, particleIndex); !neighborQuery.atEnd(); neighborQuery.next()) {
-				if(neighborQuery.distanceSquared() < minCutoffSquared)
-					continue;
-				if(moleculeIDsArray && moleculeIDsArray[particleIndex] != moleculeIDsArray[neighborQuery.current()])
-					continue;
-				int type1 = particleTypesArray[particleIndex];
-				int type2 = particleTypesArray[neighborQuery.current()];
-				if(type1 >= 0 && type1 < (int)_pairCutoffsSquared.size() && type2 >= 0 && type2 < (int)_pairCutoffsSquared[type1].size()) {
-					if(neighborQuery.distanceSquared() <= _pairCutoffsSquared[type1][type2]) {
-						Bond bond = { particleIndex, neighborQuery.current(), neighborQuery.unwrappedPbcShift() };
-						// Skip every other bond to create only one bond per particle pair.
-						if(!bond.isOdd())
-							bonds().push_back(bond);
-					}
-				}
+					threadLocalBonds.push_back(bond);
 			}
+			particleIndex++;
+
 			// Update progress indicator.
-			if(!setProgressValueIntermittent(particleIndex))
+			if((particleIndex % 1024ll) == 0)
+				promise.incrementProgressValue(1024);
+			// Abort loop when operation was canceled by the user.
+			if(promise.isCanceled())
 				return;
 		}
-	}
+		std::lock_guard<std::mutex> lock(mutex);
+		chunkBonds.emplace_back(startIndex, std::move(threadLocalBonds));
+	});
+	if(isCanceled())
+		return;
+
+	// Concatenate the per-thread bond lists such that the output order does not depend on thread scheduling.
+	std::sort(chunkBonds.begin(), chunkBonds.end(), [](const auto& a, const auto& b) { return a.first < b.first; });
+	size_t bondsCount = 0;
+	for(const auto& chunk : chunkBonds)
+		bondsCount += chunk.second.size();
+	bonds().reserve(bondsCount);
+	for(const auto& chunk : chunkBonds)
+		bonds().insert(bonds().end(), chunk.second.cbegin(), chunk.second.cend());
 	setProgressValue(particleCount);
 
 	// Release data that is no longer needed.
@@ -108,23 +108,20 @@ BondsComputePropertyModifierDelegate::ComputeEngine::ComputeEngine(
 			else
 				periodicImages.reset();
 
-			_evaluator->registerComputedVariable("BondLength", [positions=std::move(positions),topology=std::move(topology),periodicImages=std::move(periodicImages),simCell](size_t bondIndex) -> double {
+			_bondLengthFunction = [positions=std::move(positions),topology=std::move(topology),periodicImages=std::move(periodicImages),simCell](size_t bondIndex) -> double {
 				size_t index1 = topology[bondIndex][0];
 				size_t index2 = topology[bondIndex][1];
 				if(positions.size() > index1 && positions.size() > index2) {
 					const Point3& p1 = positions[index1];
 					const Point3& p2 = positions[index2];
 					Vector3 delta = p2 - p1;
-					if(periodicImages) {
-						if(int dx = periodicImages[bondIndex][0]) delta += simCell.matrix().column(0) * (FloatType)dx;
-						if(int dy = periodicImages[bondIndex][1]) delta += simCell.matrix().column(1) * (FloatType)dy;
-						if(int dz = periodicImages[bondIndex][2]) delta += simCell.matrix().column(2) * (FloatType)dz;
-					}
+					if(periodicImages)
+						delta += simCell.matrix() * Vector3(periodicImages[bondIndex]);
 					return delta.length();
 				}
 				else return 0;
-			},
-			tr("dynamically calculated"));
+			};
+			_evaluator->registerComputedVariable("BondLength", _bondLengthFunction, tr("dynamically calculated"));
 		}
 	}
 
@@ -156,6 +153,24 @@ QString BondsComputePropertyModifierDelegate::ComputeEngine::inputVariableTable(
 void BondsComputePropertyModifierDelegate::ComputeEngine::perform()
 {
 	setProgressText(tr("Computing property '%1'").arg(outputProperty()->name()));
+
+	// Fast path: If the expression consists of just the 'BondLength' variable, compute the
+	// bond lengths directly instead of going through the expression parser.
+	if(_bondLengthFunction && outputProperty()->componentCount() == 1 && _expressions.size() == 1 && _expressions.front().trimmed() == QStringLiteral("BondLength")) {
+		parallelFor(outputProperty()->size(), *this, [this](size_t bondIndex) {
+			// Skip unselected bonds if requested.
+			if(selectionArray() && !selectionArray()[bondIndex])
+				return;
+			outputArray().set(bondIndex, 0, (FloatType)_bondLengthFunction(bondIndex));
+		});
+
+		// Release data that is no longer needed to reduce memory footprint.
+		releaseWorkingData();
+		_topology.reset();
+		_bondLengthFunction = {};
+		return;
+	}
+
 	setProgressMaximum(outputProperty()->size());
 	setProgressValue(0);
 
@@ -202,6 +217,7 @@ void BondsComputePropertyModifierDelegate::ComputeEngine::perform()
 	// Release data that is no longer needed to reduce memory footprint.
 	releaseWorkingData();
 	_topology.reset();
+	_bondLengthFunction = {};
 }
 
 /******************************************************************************
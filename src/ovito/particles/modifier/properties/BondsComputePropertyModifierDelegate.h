@@ -106,6 +106,9 @@ private:
 
 		ParticleOrderingFingerprint _inputFingerprint;
 		ConstPropertyPtr _topology;
+
+		/// Computes the length of a bond. Provides the value of the 'BondLength' expression variable.
+		std::function<double(size_t)> _bondLengthFunction;
 	};
 };
 
@@ -292,8 +292,10 @@ bool GenerateTrajectoryLinesModifier::generateTrajectories(Promise<>&& operation
 			Point3* pos = trajPosProperty.begin();
 			piter = permutation.cbegin();
 			const qlonglong* id = trajIdProperty.cbegin();
-			for(auto pos_end = pos + trajPosProperty.size() - 1; pos != pos_end; ++pos, ++piter, ++id) {
-				if(!operation.incrementProgressValue())
+			for(auto pos_begin = pos, pos_end = pos + trajPosProperty.size() - 1; pos != pos_end; ++pos, ++piter, ++id) {
+				// Update the progress indicator only occasionally, because doing so for
+				// every vertex would also process user interface events for every vertex.
+				if(!operation.setProgressValueIntermittent(pos - pos_begin))
 					return false;
 				if(id[0] == id[1]) {
 					const SimulationCell& cell1 = cells[timeData[piter[0]]];
@@ -32,22 +32,25 @@ namespace Ovito { namespace Particles {
 ParticleBondMap::ParticleBondMap(ConstPropertyPtr bondTopology, ConstPropertyPtr bondPeriodicImages) :
 	_bondTopology(std::move(bondTopology)),
 	_bondPeriodicImages(std::move(bondPeriodicImages)),
-	_nextBond(_bondTopology.size()*2, _bondTopology.size()*2)
+	_halfBonds(_bondTopology.size()*2)
 {
-	for(size_t bondIndex = _bondTopology.size(); bondIndex-- != 0; ) {
-		size_t index1 = _bondTopology[bondIndex][0];
-		size_t index2 = _bondTopology[bondIndex][1];
-		if(index1 >= _startIndices.size())
-			_startIndices.resize(index1 + 1, endOfListValue());
-		if(index2 >= _startIndices.size())
-			_startIndices.resize(index2 + 1, endOfListValue());
+	// Count the number of half bonds of each particle.
+	for(const ParticleIndexPair& bond : _bondTopology) {
+		size_t maxIndex = std::max((size_t)bond[0], (size_t)bond[1]);
+		if(maxIndex + 2 > _startIndices.size())
+			_startIndices.resize(maxIndex + 2, 0);
+		_startIndices[bond[0] + 1]++;
+		_startIndices[bond[1] + 1]++;
+	}
+
+	// Convert the counts into offsets into the half bond list.
+	std::partial_sum(_startIndices.begin(), _startIndices.end(), _startIndices.begin());
 
-		size_t evenIndex = bondIndex * 2;
-		size_t oddIndex  = evenIndex + 1;
-		_nextBond[evenIndex] = _startIndices[index1];
-		_nextBond[oddIndex]  = _startIndices[index2];
-		_startIndices[index1] = evenIndex;
-		_startIndices[index2] = oddIndex;
+	// Distribute the half bonds to the particles. Each particle's list is in ascending order of the bond index.
+	std::vector<size_t> insertionPoints(_startIndices);
+	for(size_t halfBondIndex = 0; halfBondIndex < _halfBonds.size(); halfBondIndex++) {
+		size_t particleIndex = _bondTopology[halfBondIndex / 2][halfBondIndex & 1];
+		_halfBonds[insertionPoints[particleIndex]++] = halfBondIndex;
 	}
 }
 
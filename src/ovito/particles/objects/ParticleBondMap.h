@@ -41,56 +41,56 @@ public:
 
 	class bond_index_iterator : public boost::iterator_facade<bond_index_iterator, size_t const, boost::forward_traversal_tag, size_t> {
 	public:
-		bond_index_iterator() : _bondMap(nullptr), _currentIndex(0) {}
-		bond_index_iterator(const ParticleBondMap* map, size_t startIndex) :
-			_bondMap(map), _currentIndex(startIndex) {}
+		bond_index_iterator() : _bondMap(nullptr), _current(nullptr) {}
+		bond_index_iterator(const ParticleBondMap* map, const size_t* current) :
+			_bondMap(map), _current(current) {}
 	private:
-		size_t _currentIndex;
+		const size_t* _current;
 		const ParticleBondMap* _bondMap;
 
 		friend class boost::iterator_core_access;
 
 		void increment() {
-			_currentIndex = _bondMap->_nextBond[_currentIndex];
+			++_current;
 		}
 
 		bool equal(const bond_index_iterator& other) const {
 			OVITO_ASSERT(_bondMap == other._bondMap);
-			return this->_currentIndex == other._currentIndex;
+			return this->_current == other._current;
 		}
 
 		size_t dereference() const {
-			OVITO_ASSERT(_currentIndex < _bondMap->_nextBond.size());
-			return _currentIndex / 2;
+			OVITO_ASSERT(*_current < _bondMap->_bondTopology.size() * 2);
+			return *_current / 2;
 		}
 	};
 
 	class bond_iterator : public boost::iterator_facade<bond_iterator, Bond const, boost::forward_traversal_tag, Bond> {
 	public:
-		bond_iterator() : _bondMap(nullptr), _currentIndex(0) {}
-		bond_iterator(const ParticleBondMap* map, size_t startIndex) :
-			_bondMap(map), _currentIndex(startIndex) {}
+		bond_iterator() : _bondMap(nullptr), _current(nullptr) {}
+		bond_iterator(const ParticleBondMap* map, const size_t* current) :
+			_bondMap(map), _current(current) {}
 	private:
-		size_t _currentIndex;
+		const size_t* _current;
 		const ParticleBondMap* _bondMap;
 
 		friend class boost::iterator_core_access;
 
 		void increment() {
-			_currentIndex = _bondMap->_nextBond[_currentIndex];
+			++_current;
 		}
 
 		bool equal(const bond_iterator& other) const {
 			OVITO_ASSERT(_bondMap == other._bondMap);
-			return this->_currentIndex == other._currentIndex;
+			return this->_current == other._current;
 		}
 
 		Bond dereference() const {
-			OVITO_ASSERT(_currentIndex < _bondMap->_nextBond.size());
-			size_t bindex = _currentIndex / 2;
+			OVITO_ASSERT(*_current < _bondMap->_bondTopology.size() * 2);
+			size_t bindex = *_current / 2;
 			Bond bond = { (size_t)_bondMap->_bondTopology[bindex][0], (size_t)_bondMap->_bondTopology[bindex][1],
 								_bondMap->_bondPeriodicImages ? _bondMap->_bondPeriodicImages[bindex] : Vector3I::Zero() };
-			if(_currentIndex & 1) {
+			if(*_current & 1) {
 				std::swap(bond.index1, bond.index2);
 				bond.pbcShift = -bond.pbcShift;
 			}
@@ -110,27 +110,25 @@ public:
 	/// Returns an iterator range over the indices of the bonds adjacent to the given particle.
 	/// Returns real indices into the bonds list. Note that bonds can point away from and to the given particle.
 	boost::iterator_range<bond_index_iterator> bondIndicesOfParticle(size_t particleIndex) const {
-		size_t firstIndex = (particleIndex < _startIndices.size()) ? _startIndices[particleIndex] : endOfListValue();
 		return boost::iterator_range<bond_index_iterator>(
-				bond_index_iterator(this, firstIndex),
-				bond_index_iterator(this, endOfListValue()));
+				bond_index_iterator(this, firstHalfBond(particleIndex)),
+				bond_index_iterator(this, endHalfBond(particleIndex)));
 	}
 
 	/// Returns an iterator range over the bonds adjacent to the given particle.
 	/// Takes care of reversing bonds that point toward the particle. Thus, all bonds
 	/// enumerated by the iterator point away from the given particle.
 	boost::iterator_range<bond_iterator> bondsOfParticle(size_t particleIndex) const {
-		size_t firstIndex = (particleIndex < _startIndices.size()) ? _startIndices[particleIndex] : endOfListValue();
 		return boost::iterator_range<bond_iterator>(
-				bond_iterator(this, firstIndex),
-				bond_iterator(this, endOfListValue()));
+				bond_iterator(this, firstHalfBond(particleIndex)),
+				bond_iterator(this, endHalfBond(particleIndex)));
 	}
 
 	/// Returns the index of a bond in the bonds list if it exists.
 	/// Returns the total number of bonds to indicate that the bond does not exist.
 	size_t findBond(const Bond& bond) const {
-		size_t index = (bond.index1 < _startIndices.size()) ? _startIndices[bond.index1] : endOfListValue();
-		for(; index != endOfListValue(); index = _nextBond[index]) {
+		for(const size_t* iter = firstHalfBond(bond.index1), *end = endHalfBond(bond.index1); iter != end; ++iter) {
+			size_t index = *iter;
 			if((index & 1) == 0) {
 				OVITO_ASSERT(_bondTopology[index/2][0] == bond.index1);
 				if(_bondTopology[index/2][1] == bond.index2 && (!_bondPeriodicImages || _bondPeriodicImages[index/2] == bond.pbcShift))
@@ -147,8 +145,15 @@ public:
 
 private:
 
-	/// Returns the number of half bonds, which is used to indicate the end of the per-particle bond list.
-	size_t endOfListValue() const { return _nextBond.size(); }
+	/// Returns a pointer to the first half bond of the given particle.
+	const size_t* firstHalfBond(size_t particleIndex) const {
+		return _halfBonds.data() + ((particleIndex + 1 < _startIndices.size()) ? _startIndices[particleIndex] : 0);
+	}
+
+	/// Returns a pointer past the last half bond of the given particle.
+	const size_t* endHalfBond(size_t particleIndex) const {
+		return _halfBonds.data() + ((particleIndex + 1 < _startIndices.size()) ? _startIndices[particleIndex + 1] : 0);
+	}
 
 private:
 
@@ -158,11 +163,12 @@ private:
 	/// The bond property containing PBC shift vectors.
 	const ConstPropertyAccessAndRef<Vector3I> _bondPeriodicImages;
 
-	/// Contains the first bond index for each particle (the head of a linked list).
+	/// Contains the offset of each particle's first entry in the half bond list.
+	/// The list has one extra entry at the end, which holds the total number of half bonds.
 	std::vector<size_t> _startIndices;
 
-	/// Stores the index of the next bond in the linked list.
-	std::vector<size_t> _nextBond;
+	/// The half bonds (2 * bond index, plus 1 if the bond points toward the particle) grouped by particle.
+	std::vector<size_t> _halfBonds;
 };
 
 }	// End of namespace
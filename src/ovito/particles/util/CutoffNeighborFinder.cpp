@@ -156,24 +156,28 @@ bool CutoffNeighborFinder::prepare(FloatType cutoffRadius, ConstPropertyAccess<P
 			break;
 	}
 
-	// An 3d array of cubic bins.
-	// Each bin is a linked list of particles.
-	bins.resize(binCount, nullptr);
-
-	// Sort particles into bins.
-	particles.resize(positions.size());
+	// Determine the bin each particle is located in. Particles not included in the
+	// neighbor search get assigned to a virtual bin past the end of the bin array.
+	size_t particleCount = positions.size();
+	std::vector<NeighborListParticle> unsortedParticles(particleCount);
+	std::vector<size_t> particleBins(particleCount);
+	binStarts.assign(binCount + 2, 0);
 	const Point3* p = positions.cbegin();
-	for(size_t pindex = 0; pindex < particles.size(); pindex++, ++p) {
+	for(size_t pindex = 0; pindex < particleCount; pindex++, ++p) {
 
 		if(promise && promise->isCanceled())
 			return false;
 
-		NeighborListParticle& a = particles[pindex];
+		NeighborListParticle& a = unsortedParticles[pindex];
 		a.pos = *p;
 		a.pbcShift.setZero();
+		a.index = pindex;
 
-		if(selectionProperty && !selectionProperty[pindex])
+		if(selectionProperty && !selectionProperty[pindex]) {
+			particleBins[pindex] = binCount;
+			binStarts[binCount + 1]++;
 			continue;
+		}
 
 		// Determine the bin the atom is located in.
 		Point3 rp = reciprocalBinCell * (*p);
@@ -202,11 +206,25 @@ bool CutoffNeighborFinder::prepare(FloatType cutoffRadius, ConstPropertyAccess<P
 			OVITO_ASSERT(binLocation[k] >= 0 && binLocation[k] < binDim[k]);
 		}
 
-		// Put particle into its bin.
 		size_t binIndex = binLocation[0] + binLocation[1]*binDim[0] + binLocation[2]*binDim[0]*binDim[1];
-		a.nextInBin = bins[binIndex];
-		bins[binIndex] = &a;
+		particleBins[pindex] = binIndex;
+		binStarts[binIndex + 1]++;
+	}
+
+	// Convert the per-bin particle counts into start offsets.
+	std::partial_sum(binStarts.begin(), binStarts.end(), binStarts.begin());
+
+	// Sort particles into bins (counting sort), keeping the input order within each bin.
+	// Storing the particles of a bin contiguously in memory makes the neighbor queries cache-friendly.
+	particles.resize(particleCount);
+	sortedIndices.resize(particleCount);
+	std::vector<size_t> binFill(binStarts.begin(), binStarts.end() - 1);
+	for(size_t pindex = 0; pindex < particleCount; pindex++) {
+		size_t sortedIndex = binFill[particleBins[pindex]]++;
+		particles[sortedIndex] = unsortedParticles[pindex];
+		sortedIndices[pindex] = sortedIndex;
 	}
+	binStarts.pop_back();
 
 	return true;
 }
@@ -220,7 +238,7 @@ CutoffNeighborFinder::Query::Query(const CutoffNeighborFinder& finder, size_t pa
 	OVITO_ASSERT(particleIndex < _builder.particles.size());
 
 	_stencilIter = _builder.stencil.begin();
-	_center = _builder.particles[particleIndex].pos;
+	_center = _builder.particleByIndex(particleIndex).pos;
 
 	// Determine the bin the central particle is located in.
 	for(size_t k = 0; k < 3; k++) {
@@ -258,10 +276,10 @@ void CutoffNeighborFinder::Query::next()
 	OVITO_ASSERT(!_atEnd);
 
 	for(;;) {
-		while(_neighbor) {
+		while(_neighbor != _neighborEnd) {
 			_delta = _neighbor->pos - _shiftedCenter;
-			_neighborIndex = _neighbor - _builder.particles.data();
-			_neighbor = _neighbor->nextInBin;
+			_neighborIndex = _neighbor->index;
+			++_neighbor;
 			_distsq = _delta.squaredLength();
 			if(_distsq <= _builder._cutoffRadiusSquared && (_neighborIndex != _centerIndex || _pbcShift != Vector3I::Zero()))
 				return;
@@ -303,7 +321,9 @@ void CutoffNeighborFinder::Query::next()
 			}
 			++_stencilIter;
 			if(!skipBin) {
-				_neighbor = _builder.bins[_currentBin[0] + _currentBin[1] * _builder.binDim[0] + _currentBin[2] * _builder.binDim[0] * _builder.binDim[1]];
+				size_t binIndex = _currentBin[0] + _currentBin[1] * _builder.binDim[0] + _currentBin[2] * _builder.binDim[0] * _builder.binDim[1];
+				_neighbor = _builder.particles.data() + _builder.binStarts[binIndex];
+				_neighborEnd = _builder.particles.data() + _builder.binStarts[binIndex + 1];
 				break;
 			}
 		}
@@ -41,7 +41,8 @@ namespace Ovito { namespace Particles {
  *
  * The CutoffNeighborFinder class must be initialized by a call to prepare(). This function generates a grid of bin
  * cells whose size is on the order of the specified cutoff radius. It sorts all input particles into these bin cells
- * for fast neighbor queries.
+ * for fast neighbor queries. Internally, the particles are stored contiguously in bin order, so that particles located
+ * in the same bin also reside next to each other in memory.
  *
  * After the CutoffNeighborFinder has been initialized, one can find the neighbors of some central
  * particle by constructing an instance of the CutoffNeighborFinder::Query class. This is a light-weight class which
@@ -61,8 +62,8 @@ private:
 		Point3 pos;
 		/// The offset applied to the particle when wrapping it at periodic boundaries.
 		Vector3I pbcShift;
-		/// Pointer to next particle in linked list.
-		const NeighborListParticle* nextInBin;
+		/// The index of the particle in the original input array.
+		size_t index;
 	};
 
 public:
@@ -126,8 +127,8 @@ public:
 		/// Returns the PBC shift vector between the central particle and the current neighbor as if the two particles
 		/// were not wrapped at the periodic boundaries of the simulation cell.
 		Vector3I unwrappedPbcShift() const {
-			const auto& s1 = _builder.particles[_centerIndex].pbcShift;
-			const auto& s2 = _builder.particles[_neighborIndex].pbcShift;
+			const auto& s1 = _builder.particleByIndex(_centerIndex).pbcShift;
+			const auto& s2 = _builder.particleByIndex(_neighborIndex).pbcShift;
 			return Vector3I(
 					_pbcShift.x() - s1.x() + s2.x(),
 					_pbcShift.y() - s1.y() + s2.y(),
@@ -144,6 +145,7 @@ public:
 		Point3I _centerBin;
 		Point3I _currentBin;
 		const NeighborListParticle* _neighbor = nullptr;
+		const NeighborListParticle* _neighborEnd = nullptr;
 		size_t _neighborIndex = std::numeric_limits<size_t>::max();
 		Vector3I _pbcShift;
 		Vector3 _delta;
@@ -152,6 +154,12 @@ public:
 
 private:
 
+	/// Returns the internal record of the particle with the given input index.
+	const NeighborListParticle& particleByIndex(size_t index) const {
+		OVITO_ASSERT(index < sortedIndices.size());
+		return particles[sortedIndices[index]];
+	}
+
 	/// The neighbor criterion.
 	FloatType _cutoffRadius = 0;
 
@@ -167,11 +175,15 @@ private:
 	/// Used to determine the bin from a particle position.
 	AffineTransformation reciprocalBinCell;
 
-	/// The internal list of particles.
+	/// The internal list of particles, sorted by bin.
 	std::vector<NeighborListParticle> particles;
 
-	/// An 3d array of cubic bins. Each bin is a linked list of particles.
-	std::vector<const NeighborListParticle*> bins;
+	/// Maps input particle indices to positions in the sorted internal particle list.
+	std::vector<size_t> sortedIndices;
+
+	/// An 3d array of cubic bins. Each entry is the offset of the bin's first particle
+	/// in the sorted internal list. The array contains one extra entry marking the end of the last bin.
+	std::vector<size_t> binStarts;
 
 	/// The list of adjacent cells to visit while finding the neighbors of a
 	/// central particle.
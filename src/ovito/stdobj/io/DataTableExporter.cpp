@@ -49,6 +49,9 @@ bool DataTableExporter::openOutputFile(const QString& filePath, int numberOfFram
  *****************************************************************************/
 void DataTableExporter::closeOutputFile(bool exportCompleted)
 {
+	// Write any buffered text to the output file.
+	if(_outputStream && exportCompleted)
+		_outputStream->flush();
 	_outputStream.reset();
 	if(_outputFile.isOpen())
 		_outputFile.close();
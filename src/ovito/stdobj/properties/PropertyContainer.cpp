@@ -53,6 +53,71 @@ QString PropertyContainer::objectTitle() const
 	return DataObject::objectTitle();
 }
 
+/******************************************************************************
+* Rebuilds the hash index of properties if it is out of date.
+******************************************************************************/
+void PropertyContainer::updatePropertyIndex() const
+{
+	if(_propertyIndexValid.load(std::memory_order_acquire))
+		return;
+
+	std::lock_guard<std::mutex> lock(_propertyIndexMutex);
+	if(_propertyIndexValid.load(std::memory_order_relaxed))
+		return;
+
+	// If several properties share the same ID or name, the first one in the list wins, just like with a linear search.
+	_propertyTypeIndex.clear();
+	_propertyNameIndex.clear();
+	for(const PropertyObject* property : properties()) {
+		if(property->type() != 0)
+			_propertyTypeIndex.emplace(property->type(), property);
+		else if(!_propertyNameIndex.contains(property->name()))
+			_propertyNameIndex.insert(property->name(), property);
+	}
+	_propertyIndexValid.store(true, std::memory_order_release);
+}
+
+/******************************************************************************
+* Is called when a RefTarget referenced by this object has generated an event.
+******************************************************************************/
+bool PropertyContainer::referenceEvent(RefTarget* source, const ReferenceEvent& event)
+{
+	// The name of one of the properties may have changed.
+	if(event.type() == ReferenceEvent::TargetChanged && properties().contains(static_cast<PropertyObject*>(source)))
+		invalidatePropertyIndex();
+	return DataObject::referenceEvent(source, event);
+}
+
+/******************************************************************************
+* Is called when a RefTarget has been added to a VectorReferenceField of this RefMaker.
+******************************************************************************/
+void PropertyContainer::referenceInserted(const PropertyFieldDescriptor& field, RefTarget* newTarget, int listIndex)
+{
+	if(field == PROPERTY_FIELD(properties))
+		invalidatePropertyIndex();
+	DataObject::referenceInserted(field, newTarget, listIndex);
+}
+
+/******************************************************************************
+* Is called when a RefTarget has been removed from a VectorReferenceField of this RefMaker.
+******************************************************************************/
+void PropertyContainer::referenceRemoved(const PropertyFieldDescriptor& field, RefTarget* oldTarget, int listIndex)
+{
+	if(field == PROPERTY_FIELD(properties))
+		invalidatePropertyIndex();
+	DataObject::referenceRemoved(field, oldTarget, listIndex);
+}
+
+/******************************************************************************
+* Is called when the value of a reference field of this RefMaker changes.
+******************************************************************************/
+void PropertyContainer::referenceReplaced(const PropertyFieldDescriptor& field, RefTarget* oldTarget, RefTarget* newTarget)
+{
+	if(field == PROPERTY_FIELD(properties))
+		invalidatePropertyIndex();
+	DataObject::referenceReplaced(field, oldTarget, newTarget);
+}
+
 /******************************************************************************
 * Returns the given standard property. If it does not exist, an exception is thrown.
 ******************************************************************************/
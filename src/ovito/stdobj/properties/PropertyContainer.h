@@ -79,6 +79,12 @@ public:
 	const PropertyObject* getProperty(int typeId) const {
 		OVITO_ASSERT(typeId != 0);
 		OVITO_ASSERT(getOOMetaClass().isValidStandardPropertyId(typeId));
+		// Long property lists are searched using a hash index.
+		if(properties().size() >= PropertyIndexThreshold) {
+			updatePropertyIndex();
+			auto iter = _propertyTypeIndex.find(typeId);
+			return (iter != _propertyTypeIndex.end()) ? iter->second : nullptr;
+		}
 		for(const PropertyObject* property : properties()) {
 			if(property->type() == typeId)
 				return property;
@@ -89,6 +95,11 @@ public:
 	/// Looks up the user-defined property with the given name.
 	const PropertyObject* getProperty(const QString& name) const {
 		OVITO_ASSERT(!name.isEmpty());
+		// Long property lists are searched using a hash index.
+		if(properties().size() >= PropertyIndexThreshold) {
+			updatePropertyIndex();
+			return _propertyNameIndex.value(name, nullptr);
+		}
 		for(const PropertyObject* property : properties()) {
 			if(property->type() == 0 && property->name() == name)
 				return property;
@@ -159,8 +170,29 @@ protected:
 	/// Loads the class' contents from the given stream.
 	virtual void loadFromStream(ObjectLoadStream& stream) override;
 
+	/// Is called when a RefTarget referenced by this object has generated an event.
+	virtual bool referenceEvent(RefTarget* source, const ReferenceEvent& event) override;
+
+	/// Is called when a RefTarget has been added to a VectorReferenceField of this RefMaker.
+	virtual void referenceInserted(const PropertyFieldDescriptor& field, RefTarget* newTarget, int listIndex) override;
+
+	/// Is called when a RefTarget has been removed from a VectorReferenceField of this RefMaker.
+	virtual void referenceRemoved(const PropertyFieldDescriptor& field, RefTarget* oldTarget, int listIndex) override;
+
+	/// Is called when the value of a reference field of this RefMaker changes.
+	virtual void referenceReplaced(const PropertyFieldDescriptor& field, RefTarget* oldTarget, RefTarget* newTarget) override;
+
 private:
 
+	/// Number of properties above which property lookups use the hash index instead of a linear search.
+	static constexpr int PropertyIndexThreshold = 8;
+
+	/// Rebuilds the hash index of properties if it is out of date.
+	void updatePropertyIndex() const;
+
+	/// Marks the hash index of properties as out of date.
+	void invalidatePropertyIndex() { _propertyIndexValid.store(false, std::memory_order_release); }
+
 	/// Holds the list of properties.
 	DECLARE_MODIFIABLE_VECTOR_REFERENCE_FIELD(PropertyObject, properties, setProperties);
 
@@ -169,6 +201,18 @@ private:
 
 	/// The assigned title of the data object, which is displayed in the user interface.
 	DECLARE_MODIFIABLE_PROPERTY_FIELD(QString, title, setTitle);
+
+	/// Lazily built index mapping standard property IDs to properties.
+	mutable std::unordered_map<int, const PropertyObject*> _propertyTypeIndex;
+
+	/// Lazily built index mapping names to user-defined properties.
+	mutable QHash<QString, const PropertyObject*> _propertyNameIndex;
+
+	/// Indicates whether the property indices are up to date.
+	mutable std::atomic<bool> _propertyIndexValid{false};
+
+	/// Serializes the lazy construction of the property indices by concurrent readers.
+	mutable std::mutex _propertyIndexMutex;
 };
 
 /// Encapsulates a reference to a PropertyContainer in a PipelineFlowState.
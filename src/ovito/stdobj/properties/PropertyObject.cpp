@@ -170,6 +170,70 @@ void PropertyObject::replicate(size_t n, bool replicateValues)
 	}
 }
 
+/******************************************************************************
+* Rebuilds the hash index of element types if it is out of date.
+******************************************************************************/
+void PropertyObject::updateElementTypeIndex() const
+{
+	if(_elementTypeIndexValid.load(std::memory_order_acquire))
+		return;
+
+	std::lock_guard<std::mutex> lock(_elementTypeIndexMutex);
+	if(_elementTypeIndexValid.load(std::memory_order_relaxed))
+		return;
+
+	// If several types share the same ID or name, the first one in the list wins, just like with a linear search.
+	_elementTypeIdIndex.clear();
+	_elementTypeNameIndex.clear();
+	for(ElementType* type : elementTypes()) {
+		_elementTypeIdIndex.emplace(type->numericId(), type);
+		if(!type->name().isEmpty() && !_elementTypeNameIndex.contains(type->name()))
+			_elementTypeNameIndex.insert(type->name(), type);
+	}
+	_elementTypeIndexValid.store(true, std::memory_order_release);
+}
+
+/******************************************************************************
+* Is called when a RefTarget referenced by this object has generated an event.
+******************************************************************************/
+bool PropertyObject::referenceEvent(RefTarget* source, const ReferenceEvent& event)
+{
+	// The ID or name of one of the element types may have changed.
+	if(event.type() == ReferenceEvent::TargetChanged && elementTypes().contains(static_cast<ElementType*>(source)))
+		invalidateElementTypeIndex();
+	return DataObject::referenceEvent(source, event);
+}
+
+/******************************************************************************
+* Is called when a RefTarget has been added to a VectorReferenceField of this RefMaker.
+******************************************************************************/
+void PropertyObject::referenceInserted(const PropertyFieldDescriptor& field, RefTarget* newTarget, int listIndex)
+{
+	if(field == PROPERTY_FIELD(elementTypes))
+		invalidateElementTypeIndex();
+	DataObject::referenceInserted(field, newTarget, listIndex);
+}
+
+/******************************************************************************
+* Is called when a RefTarget has been removed from a VectorReferenceField of this RefMaker.
+******************************************************************************/
+void PropertyObject::referenceRemoved(const PropertyFieldDescriptor& field, RefTarget* oldTarget, int listIndex)
+{
+	if(field == PROPERTY_FIELD(elementTypes))
+		invalidateElementTypeIndex();
+	DataObject::referenceRemoved(field, oldTarget, listIndex);
+}
+
+/******************************************************************************
+* Is called when the value of a reference field of this RefMaker changes.
+******************************************************************************/
+void PropertyObject::referenceReplaced(const PropertyFieldDescriptor& field, RefTarget* oldTarget, RefTarget* newTarget)
+{
+	if(field == PROPERTY_FIELD(elementTypes))
+		invalidateElementTypeIndex();
+	DataObject::referenceReplaced(field, oldTarget, newTarget);
+}
+
 /******************************************************************************
 * Puts the property array into a writable state.
 * In the writable state, the Python binding layer will allow write access
@@ -182,6 +182,12 @@ public:
 
 	/// Returns the element type with the given ID, or NULL if no such type exists.
 	ElementType* elementType(int id) const {
+		// Long type lists are searched using a hash index.
+		if(elementTypes().size() >= ElementTypeIndexThreshold) {
+			updateElementTypeIndex();
+			auto iter = _elementTypeIdIndex.find(id);
+			return (iter != _elementTypeIdIndex.end()) ? iter->second : nullptr;
+		}
 		for(ElementType* type : elementTypes())
 			if(type->numericId() == id)
 				return type;
@@ -191,6 +197,11 @@ public:
 	/// Returns the element type with the given human-readable name, or NULL if no such type exists.
 	ElementType* elementType(const QString& name) const {
 		OVITO_ASSERT(!name.isEmpty());
+		// Long type lists are searched using a hash index.
+		if(elementTypes().size() >= ElementTypeIndexThreshold) {
+			updateElementTypeIndex();
+			return _elementTypeNameIndex.value(name, nullptr);
+		}
 		for(ElementType* type : elementTypes())
 			if(type->name() == name)
 				return type;
@@ -278,8 +289,29 @@ protected:
 	/// Is called when the value of a non-animatable field of this object changes.
 	virtual void propertyChanged(const PropertyFieldDescriptor& field) override;
 
+	/// Is called when a RefTarget referenced by this object has generated an event.
+	virtual bool referenceEvent(RefTarget* source, const ReferenceEvent& event) override;
+
+	/// Is called when a RefTarget has been added to a VectorReferenceField of this RefMaker.
+	virtual void referenceInserted(const PropertyFieldDescriptor& field, RefTarget* newTarget, int listIndex) override;
+
+	/// Is called when a RefTarget has been removed from a VectorReferenceField of this RefMaker.
+	virtual void referenceRemoved(const PropertyFieldDescriptor& field, RefTarget* oldTarget, int listIndex) override;
+
+	/// Is called when the value of a reference field of this RefMaker changes.
+	virtual void referenceReplaced(const PropertyFieldDescriptor& field, RefTarget* oldTarget, RefTarget* newTarget) override;
+
 private:
 
+	/// Number of element types above which type lookups use the hash index instead of a linear search.
+	static constexpr int ElementTypeIndexThreshold = 8;
+
+	/// Rebuilds the hash index of element types if it is out of date.
+	void updateElementTypeIndex() const;
+
+	/// Marks the hash index of element types as out of date.
+	void invalidateElementTypeIndex() { _elementTypeIndexValid.store(false, std::memory_order_release); }
+
 	/// The internal per-element data.
 	DECLARE_RUNTIME_PROPERTY_FIELD(PropertyPtr, storage, setStorage);
 
@@ -292,6 +324,18 @@ private:
 	/// This is a special flag used by the Python bindings to indicate that
 	/// this property object has been temporarily put into a writable state.
 	int _isWritableFromPython = 0;
+
+	/// Lazily built index mapping numeric IDs to element types.
+	mutable std::unordered_map<int, ElementType*> _elementTypeIdIndex;
+
+	/// Lazily built index mapping names to element types.
+	mutable QHash<QString, ElementType*> _elementTypeNameIndex;
+
+	/// Indicates whether the element type indices are up to date.
+	mutable std::atomic<bool> _elementTypeIndexValid{false};
+
+	/// Serializes the lazy construction of the element type indices by concurrent readers.
+	mutable std::mutex _elementTypeIndexMutex;
 };
 
 }	// End of namespace
@@ -25,6 +25,8 @@
 
 #include <ovito/vorotop/VoroTopPlugin.h>
 
+#include <boost/functional/hash.hpp>
+
 namespace Ovito { namespace VoroTop {
 
 /**
@@ -80,7 +82,7 @@ private:
 	QStringList _structureTypeDescriptions;
 
 	/// Mapping from Weinberg vectors to structure types.
-	std::map<WeinbergVector, int> _entries;
+	std::unordered_map<WeinbergVector, int, boost::hash<WeinbergVector>> _entries;
 
 	/// Comment text loaded from the filter definition file.
 	QString _filterDescription;